@@ -1,4 +1,5 @@
 import os
+import shutil
 from pathlib import Path
 from typing import List
 
@@ -24,8 +25,8 @@ class WorkspaceStore(BaseStore):
                         f'file {f.filename} already exists in workspace {workspace_id}, will be replaced'
                     )
                 with open(dest, 'wb+') as fp:
-                    content = f.file.read()
-                    fp.write(content)
+                    # stream in chunks, an uploaded index can be larger than the memory
+                    shutil.copyfileobj(f.file, fp, 1 << 20)
                 self._logger.info(f'saved uploads to {dest}')
         except Exception as e:
             self._logger.error(f'{e!r}')
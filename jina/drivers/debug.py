@@ -26,8 +26,7 @@ class PngToDiskDriver(FlatRecursiveMixin, BaseRecursiveDriver):
         self.done = 0
         self.workspace = workspace
         self.folder = os.path.join(self.workspace, self.prefix)
-        if not os.path.exists(self.folder):
-            os.makedirs(self.folder)
+        os.makedirs(self.folder, exist_ok=True)
         super().__init__(*args, **kwargs)
 
     def _apply_all(
@@ -10,6 +10,8 @@ from .. import BaseExecutor
 from ..compound import CompoundExecutor
 from ...helper import call_obj_fn, cached_property, get_readable_size
 
+WRITE_BUFFER_SIZE = 1 << 20  #: the buffer size of the file-based write handlers, in bytes
+
 
 class BaseIndexer(BaseExecutor):
     """Base class for storing and searching any kind of data structure.
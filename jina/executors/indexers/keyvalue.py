@@ -4,16 +4,30 @@ __license__ = "Apache-2.0"
 import mmap
 import os
 import random
+from functools import lru_cache
 from typing import Iterable, Optional
 
 import numpy as np
 
-from . import BaseKVIndexer
+from . import BaseKVIndexer, WRITE_BUFFER_SIZE
 from ..compound import CompoundExecutor
+from ...helper import fadvise_sequential
 
 HEADER_NONE_ENTRY = (-1, -1, -1)
 
 
+@lru_cache(maxsize=3)
+def _get_header_dtype(key_length: int) -> 'np.dtype':
+    return np.dtype(
+        [
+            ('key', (np.str_, key_length)),
+            ('page', np.int64),
+            ('start', np.int64),
+            ('end', np.int64),
+        ]
+    )
+
+
 class BinaryPbIndexer(BaseKVIndexer):
     """Simple Key-value indexer."""
 
@@ -26,8 +40,8 @@ class BinaryPbIndexer(BaseKVIndexer):
         """
 
         def __init__(self, path, mode):
-            self.body = open(path, mode)
-            self.header = open(path + '.head', mode)
+            self.body = open(path, mode, buffering=WRITE_BUFFER_SIZE)
+            self.header = open(path + '.head', mode, buffering=WRITE_BUFFER_SIZE)
 
         def close(self):
             """Close the file."""
@@ -53,26 +67,46 @@ class BinaryPbIndexer(BaseKVIndexer):
 
         def __init__(self, path, key_length):
             with open(path + '.head', 'rb') as fp:
-                tmp = np.frombuffer(
-                    fp.read(),
-                    dtype=[
-                        ('', (np.str_, key_length)),
-                        ('', np.int64),
-                        ('', np.int64),
-                        ('', np.int64),
-                    ],
-                )
+                fadvise_sequential(fp)
+                # the header is a fixed-width record array, read it in one go
+                tmp = np.fromfile(fp, dtype=_get_header_dtype(key_length))
+                # convert the columns to python objects once, instead of indexing
+                # a numpy record and calling `np.array_equal` for every entry
                 self.header = {
-                    r[0]: None
-                    if np.array_equal((r[1], r[2], r[3]), HEADER_NONE_ENTRY)
-                    else (r[1], r[2], r[3])
-                    for r in tmp
+                    k: None if (p, r, l) == HEADER_NONE_ENTRY else (p, r, l)
+                    for k, p, r, l in zip(
+                        tmp['key'].tolist(),
+                        tmp['page'].tolist(),
+                        tmp['start'].tolist(),
+                        tmp['end'].tolist(),
+                    )
                 }
             self._body = open(path, 'r+b')
             self.body = self._body.fileno()
+            # map the whole body once, a lookup is then a slice instead of a ``mmap`` per document
+            self._mmap = (
+                mmap.mmap(self.body, 0, access=mmap.ACCESS_READ)
+                if os.fstat(self.body).st_size
+                else None
+            )
+
+        def read(self, p: int, r: int, l: int) -> bytes:
+            """
+            Read the value located by a header entry.
+
+            :param p: offset of the page
+            :param r: start position in the page
+            :param l: end position in the page
+            :return: the value in bytes
+            """
+            if self._mmap is None:
+                return b''
+            return self._mmap[p + r : p + l]
 
         def close(self):
             """Close the file."""
+            if self._mmap is not None and not self._mmap.closed:
+                self._mmap.close()
             if not self._body.closed:
                 self._body.close()
 
@@ -97,10 +131,8 @@ class BinaryPbIndexer(BaseKVIndexer):
         for key in read_handler.header.keys():
             pos_info = read_handler.header.get(key, None)
             if pos_info:
-                p, r, l = pos_info
-                with mmap.mmap(read_handler.body, offset=p, length=l) as m:
-                    keys.append(key)
-                    vals.append(m[r:])
+                keys.append(key)
+                vals.append(read_handler.read(*pos_info))
         read_handler.close()
         if len(keys) == 0:
             return
@@ -167,29 +199,7 @@ class BinaryPbIndexer(BaseKVIndexer):
         if not any(keys):
             return
 
-        for key, value in zip(keys, values):
-            l = len(value)  #: the length
-            p = (
-                int(self._start / self._page_size) * self._page_size
-            )  #: offset of the page
-            r = (
-                self._start % self._page_size
-            )  #: the remainder, i.e. the start position given the offset
-            self.write_handler.header.write(
-                np.array(
-                    (key, p, r, r + l),
-                    dtype=[
-                        ('', (np.str_, self.key_length)),
-                        ('', np.int64),
-                        ('', np.int64),
-                        ('', np.int64),
-                    ],
-                ).tobytes()
-            )
-            self._start += l
-            self.write_handler.body.write(value)
-            self._size += 1
-        self.write_handler.flush()
+        self._add(keys, values, self.write_handler)
 
     def sample(self) -> Optional[bytes]:
         """Return a random entry from the indexer for sanity check.
@@ -213,9 +223,7 @@ class BinaryPbIndexer(BaseKVIndexer):
         """
         pos_info = self.query_handler.header.get(key, None)
         if pos_info is not None:
-            p, r, l = pos_info
-            with mmap.mmap(self.query_handler.body, offset=p, length=l) as m:
-                return m[r:]
+            return self.query_handler.read(*pos_info)
 
     def update(
         self, keys: Iterable[str], values: Iterable[bytes], *args, **kwargs
@@ -237,19 +245,13 @@ class BinaryPbIndexer(BaseKVIndexer):
             self.add(keys, values)
 
     def _delete(self, keys: Iterable[str]) -> None:
-        for key in keys:
-            self.write_handler.header.write(
-                np.array(
-                    tuple(np.concatenate([[key], HEADER_NONE_ENTRY])),
-                    dtype=[
-                        ('', (np.str_, self.key_length)),
-                        ('', np.int64),
-                        ('', np.int64),
-                        ('', np.int64),
-                    ],
-                ).tobytes()
-            )
-            self._size -= 1
+        header = np.array(
+            [(key, *HEADER_NONE_ENTRY) for key in keys],
+            dtype=_get_header_dtype(self.key_length),
+        )
+        if header.size:
+            self.write_handler.header.write(header.tobytes())
+            self._size -= header.size
 
     def delete(self, keys: Iterable[str], *args, **kwargs) -> None:
         """Delete the serialized documents from the index via document ids.
@@ -265,29 +267,30 @@ class BinaryPbIndexer(BaseKVIndexer):
             self._delete(keys)
 
     def _add(self, keys: Iterable[str], values: Iterable[bytes], writer: WriteHandler):
+        body = []
+        header_keys = []
         for key, value in zip(keys, values):
-            l = len(value)  #: the length
-            p = (
-                int(self._start / self._page_size) * self._page_size
+            header_keys.append(key)
+            body.append(value)
+        if body:
+            # the offsets of the whole batch are computed at once,
+            # and each file receives a single ``write`` instead of one per document
+            lengths = np.fromiter(map(len, body), dtype=np.int64, count=len(body))
+            ends = self._start + np.cumsum(lengths)
+            starts = ends - lengths
+            header = np.empty(len(body), dtype=_get_header_dtype(self.key_length))
+            header['key'] = header_keys
+            header['page'] = (
+                starts // self._page_size * self._page_size
             )  #: offset of the page
-            r = (
-                self._start % self._page_size
+            header['start'] = (
+                starts % self._page_size
             )  #: the remainder, i.e. the start position given the offset
-            # noinspection PyTypeChecker
-            writer.header.write(
-                np.array(
-                    (key, p, r, r + l),
-                    dtype=[
-                        ('', (np.str_, self.key_length)),
-                        ('', np.int64),
-                        ('', np.int64),
-                        ('', np.int64),
-                    ],
-                ).tobytes()
-            )
-            self._start += l
-            writer.body.write(value)
-            self._size += 1
+            header['end'] = header['start'] + lengths
+            writer.header.write(header.tobytes())
+            writer.body.write(b''.join(body))
+            self._start = int(ends[-1])
+            self._size += len(body)
         writer.flush()
 
 
@@ -11,11 +11,13 @@ from typing import Optional, Iterable, Tuple, Dict, Union
 
 import numpy as np
 
-from . import BaseVectorIndexer
+from . import BaseVectorIndexer, WRITE_BUFFER_SIZE
 from ..decorators import batching
-from ...helper import cached_property
+from ...helper import cached_property, fadvise_sequential
 from ...importer import ImportExtensions
 
+GZIP_READ_CHUNK_SIZE = 1 << 20  #: decompressed bytes read at once when loading a gzip index
+
 
 class BaseNumpyIndexer(BaseVectorIndexer):
     """
@@ -38,6 +40,9 @@ class BaseNumpyIndexer(BaseVectorIndexer):
     :param ref_indexer: Bootstrap the current indexer from a ``ref_indexer``. This enables user to switch
                         the query algorithm at the query time.
     :param delete_on_dump: whether to delete the rows marked as delete (see ``valid_indices``)
+    :param dtype: the dtype used for storing the vectors, e.g. ``float32``. Added vectors are cast to it, which
+                  halves the index size for ``float64`` embeddings. By default, the dtype of the first added
+                  vectors is kept and later vectors must match it.
     """
 
     def __init__(
@@ -45,15 +50,17 @@ class BaseNumpyIndexer(BaseVectorIndexer):
         compress_level: int = 1,
         ref_indexer: Optional['BaseNumpyIndexer'] = None,
         delete_on_dump: bool = False,
+        dtype: Optional[str] = None,
         *args,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
         self.num_dim = None
         self.dtype = None
+        self.index_dtype = dtype
         self.delete_on_dump = delete_on_dump
         self.compress_level = compress_level
-        self.key_bytes = b''
+        self.key_bytes = bytearray()  #: grows in place, ``bytes +=`` would copy all keys on every add
         self.valid_indices = np.array([], dtype=bool)
         self.ref_indexer_workspace_name = None
 
@@ -61,8 +68,9 @@ class BaseNumpyIndexer(BaseVectorIndexer):
             # copy the header info of the binary file
             self.num_dim = ref_indexer.num_dim
             self.dtype = ref_indexer.dtype
+            self.index_dtype = getattr(ref_indexer, 'index_dtype', None)
             self.compress_level = ref_indexer.compress_level
-            self.key_bytes = ref_indexer.key_bytes
+            self.key_bytes = bytearray(ref_indexer.key_bytes)
             self.key_length = ref_indexer.key_length
             self._size = ref_indexer._size
             # point to the ref_indexer.index_filename
@@ -92,7 +100,7 @@ class BaseNumpyIndexer(BaseVectorIndexer):
         valid_key_bytes = np.frombuffer(
             self.key_bytes, dtype=(np.str_, self.key_length)
         )[self.valid_indices].tobytes()
-        self.key_bytes = valid_key_bytes
+        self.key_bytes = bytearray(valid_key_bytes)
         self._size = len(valid)
         self.valid_indices = valid
         del self._int2ext_id
@@ -120,7 +128,7 @@ class BaseNumpyIndexer(BaseVectorIndexer):
                 new_gzip_fh.write(filtered.tobytes())
         else:
             with open(tmp_path, 'wb') as filtered_data_fh:
-                filtered_data_fh.write(filtered.tobytes())
+                filtered.tofile(filtered_data_fh)
 
         os.remove(self.index_abspath)
         os.rename(tmp_path, self.index_abspath)
@@ -168,7 +176,7 @@ class BaseNumpyIndexer(BaseVectorIndexer):
                 self.index_abspath, 'ab', compresslevel=self.compress_level
             )
         else:
-            return open(self.index_abspath, 'ab')
+            return open(self.index_abspath, 'ab', buffering=WRITE_BUFFER_SIZE)
 
     def get_create_handler(self) -> 'io.BufferedWriter':
         """Create a new gzip file for adding new vectors. The old vectors are replaced.
@@ -180,7 +188,7 @@ class BaseNumpyIndexer(BaseVectorIndexer):
                 self.index_abspath, 'wb', compresslevel=self.compress_level
             )
         else:
-            return open(self.index_abspath, 'wb')
+            return open(self.index_abspath, 'wb', buffering=WRITE_BUFFER_SIZE)
 
     def _validate_key_vector_shapes(self, keys, vectors):
         if len(vectors.shape) != 2:
@@ -218,8 +226,14 @@ class BaseNumpyIndexer(BaseVectorIndexer):
 
     def _add(self, keys: 'np.ndarray', vectors: 'np.ndarray'):
         if keys.size and vectors.size:
+            if getattr(self, 'index_dtype', None):
+                vectors = vectors.astype(self.index_dtype, copy=False)
             self._validate_key_vector_shapes(keys, vectors)
-            self.write_handler.write(vectors.tobytes())
+            if self.compress_level > 0:
+                self.write_handler.write(vectors.tobytes())
+            else:
+                # write straight from the array buffer, no intermediate ``bytes`` copy
+                vectors.tofile(self.write_handler)
             self.valid_indices = np.concatenate(
                 (self.valid_indices, np.full(len(keys), True))
             )
@@ -298,6 +312,9 @@ class BaseNumpyIndexer(BaseVectorIndexer):
         try:
             self.logger.info(f'loading index from {abspath}...')
             with gzip.open(abspath, mode) as fp:
+                fadvise_sequential(fp)
+                if self.num_dim and self.dtype:
+                    return self._read_gzip_vectors(fp)
                 return np.frombuffer(fp.read(), dtype=self.dtype).reshape(
                     [-1, self.num_dim]
                 )
@@ -306,6 +323,28 @@ class BaseNumpyIndexer(BaseVectorIndexer):
                 f'{abspath} is broken/incomplete, perhaps forgot to ".close()" in the last usage?'
             )
 
+    def _read_gzip_vectors(self, fp: 'gzip.GzipFile') -> 'np.ndarray':
+        # decompress chunk by chunk into a preallocated array, so that the decompressed
+        # file is not held in a temporary ``bytes`` next to the array
+        # `==` is required. `is False` does not work in np
+        deleted_keys = len(self.valid_indices[self.valid_indices == False])  # noqa
+        vecs = np.empty((self.size + deleted_keys, self.num_dim), dtype=self.dtype)
+        buffer = memoryview(vecs.reshape(-1).view(np.uint8))
+        pos = 0
+        while pos < len(buffer):
+            chunk = fp.read(min(GZIP_READ_CHUNK_SIZE, len(buffer) - pos))
+            if not chunk:
+                break
+            buffer[pos : pos + len(chunk)] = chunk
+            pos += len(chunk)
+        rest = fp.read()
+        if pos < len(buffer) or rest:
+            # the file does not match the indexer's size, return what is on the disk,
+            # the inconsistency is reported by `_int2ext_id`
+            data = buffer[:pos].tobytes() + rest
+            return np.frombuffer(data, dtype=self.dtype).reshape([-1, self.num_dim])
+        return vecs
+
     @cached_property
     def _raw_ndarray(self) -> Union['np.ndarray', 'np.memmap', None]:
         if not (path.exists(self.index_abspath) or self.num_dim or self.dtype):
@@ -361,7 +400,8 @@ class BaseNumpyIndexer(BaseVectorIndexer):
         .. # noqa: DAR201
         """
         if self.key_bytes:
-            r = np.frombuffer(self.key_bytes, dtype=(np.str_, self.key_length))
+            # copy, a view would pin ``key_bytes`` and block any later append to it
+            r = np.frombuffer(bytes(self.key_bytes), dtype=(np.str_, self.key_length))
             # `==` is required. `is False` does not work in np
             deleted_keys = len(self.valid_indices[self.valid_indices == False])  # noqa
             if r.shape[0] == (self.size + deleted_keys) == self._raw_ndarray.shape[0]:
@@ -163,8 +163,22 @@ def touch_dir(base_dir: str) -> None:
 
     :param base_dir: Path of target path.
     """
-    if not os.path.exists(base_dir):
-        os.makedirs(base_dir)
+    os.makedirs(base_dir, exist_ok=True)
+
+
+def fadvise_sequential(fp) -> None:
+    """
+    Advise the kernel that a file will be read sequentially, so that it uses a larger read-ahead window.
+
+    Does nothing without ``os.posix_fadvise`` (e.g. on Windows and macOS) or when ``fp`` has no file descriptor.
+
+    :param fp: Opened file object.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError, ValueError):
+            pass
 
 
 def batch_iterator(
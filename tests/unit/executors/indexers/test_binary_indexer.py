@@ -199,3 +199,30 @@ def test_kvindexer_iterate(test_metas):
 
     with BaseIndexer.load(save_abspath) as idxer:
         assert list(idxer) == [b'oldvalue', b'same', b'random']
+
+
+def test_binarypb_add_batch_across_pages(test_metas):
+    keys = [str(j) for j in range(100)]
+    values = [str(j).encode() * (j * 17 + 1) for j in range(100)]
+    with BinaryPbIndexer(metas=test_metas) as idxer:
+        idxer.add(keys[:50], values[:50])
+        idxer.add(keys[50:], values[50:])
+        idxer.save()
+        assert idxer.size == 100
+        save_abspath = idxer.save_abspath
+
+    with BaseIndexer.load(save_abspath) as idxer:
+        for key, value in zip(keys, values):
+            assert idxer.query(key) == value
+
+
+def test_binarypb_empty_value(test_metas):
+    with BinaryPbIndexer(metas=test_metas) as idxer:
+        idxer.add(['1', '2', '3'], [b'', b'same', b''])
+        idxer.save()
+        save_abspath = idxer.save_abspath
+
+    with BaseIndexer.load(save_abspath) as idxer:
+        assert idxer.query('1') == b''
+        assert idxer.query('2') == b'same'
+        assert idxer.query('3') == b''
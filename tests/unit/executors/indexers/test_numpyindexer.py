@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from jina.executors.indexers import BaseIndexer
+from jina.executors.indexers import vector
 from jina.executors.indexers.vector import NumpyIndexer
 
 # fix the seed here
@@ -82,6 +83,49 @@ def test_numpy_indexer_assert_shape_mismatch(test_metas):
             indexer.add(vec_keys, vec_short)
 
 
+@pytest.mark.parametrize('compress_level', [0, 1])
+def test_numpy_indexer_dtype(compress_level, test_metas):
+    with NumpyIndexer(
+        metric='euclidean',
+        index_filename='np.test.gz',
+        compress_level=compress_level,
+        dtype='float32',
+        metas=test_metas,
+    ) as indexer:
+        indexer.add(vec_idx[:50], vec[:50])
+        indexer.add(vec_idx[50:], vec[50:])
+        indexer.save()
+        index_size = os.path.getsize(indexer.index_abspath)
+        save_abspath = indexer.save_abspath
+
+    if compress_level == 0:
+        assert index_size == num_data * num_dim * np.dtype(np.float32).itemsize
+
+    with BaseIndexer.load(save_abspath) as indexer:
+        assert indexer.dtype == 'float32'
+        assert indexer.query_handler.dtype == np.float32
+        idx, dist = indexer.query(query, top_k=4)
+        assert idx.shape == dist.shape
+        assert idx.shape == (num_query, 4)
+
+
+def test_numpy_indexer_gzip_chunked_load(test_metas, monkeypatch):
+    with NumpyIndexer(
+        metric='euclidean',
+        index_filename='np.test.gz',
+        compress_level=1,
+        metas=test_metas,
+    ) as indexer:
+        indexer.add(vec_idx, vec)
+        indexer.save()
+        save_abspath = indexer.save_abspath
+
+    # a chunk size that does not divide a row
+    monkeypatch.setattr(vector, 'GZIP_READ_CHUNK_SIZE', 1000)
+    with BaseIndexer.load(save_abspath) as indexer:
+        np.testing.assert_equal(indexer.query_handler, vec)
+
+
 @pytest.mark.parametrize(
     'batch_size, compress_level', [(None, 0), (None, 1), (16, 0), (16, 1)]
 )
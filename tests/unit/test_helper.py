@@ -13,6 +13,7 @@ from jina.helper import (
     cached_property,
     convert_tuple_to_list,
     deprecated_alias,
+    fadvise_sequential,
     is_yaml_filepath,
     touch_dir,
     random_port,
@@ -260,6 +261,16 @@ def test_touch_dir(tmpdir):
     assert os.path.exists(tmpdir)
 
 
+def test_fadvise_sequential(tmpdir):
+    with open(str(tmpdir / 'a.bin'), 'wb') as fp:
+        fp.write(b'hello')
+    with open(str(tmpdir / 'a.bin'), 'rb') as fp:
+        fadvise_sequential(fp)
+        assert fp.read() == b'hello'
+    # objects without a file descriptor are ignored
+    fadvise_sequential(object())
+
+
 @pytest.fixture
 def config():
     os.environ['JINA_RANDOM_PORTS'] = "True"